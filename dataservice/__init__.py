@@ -5,8 +5,11 @@ from dataservice.clients import (
     PlaywrightPage,
 )
 from dataservice.config import (
+    BrowserType,
     CacheConfig,
+    CacheType,
     DelayConfig,
+    DelayType,
     PlaywrightConfig,
     ProxyConfig,
     RateLimiterConfig,
@@ -22,11 +25,14 @@ from dataservice.service import AsyncDataService, DataService
 __all__ = [
     "AsyncDataService",
     "BaseDataItem",
+    "BrowserType",
     "CacheConfig",
+    "CacheType",
     "DataService",
     "DataServiceException",
     "DataWrapper",
     "DelayConfig",
+    "DelayType",
     "FailedRequest",
     "HttpXClient",
     "PlaywrightClient",
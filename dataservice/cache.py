@@ -14,8 +14,8 @@ from functools import wraps
 from pathlib import Path
 from typing import Any, Awaitable, Callable, Optional
 
-from dataservice import CacheConfig
-from dataservice.models import Request, Response
+from dataservice.config import CacheConfig, CacheType
+from dataservice.models import ClientCallable, Request, Response
 
 logger = logging.getLogger(__name__)
 
@@ -189,12 +189,17 @@ async def cache_request(cache: AsyncCache) -> Callable:
     :param cache: The cache to use.
     """
 
-    async def wrapped_request(request: Request, delay: int | None = None) -> Response:
+    async def wrapped_request(
+        request: Request,
+        delay: int | None = None,
+        client: ClientCallable | None = None,
+    ) -> Response:
         """
         Wraps a function to cache its results.
 
         :param request: The request to cache.
         :param delay: The delay in seconds to wait before making the request.
+        :param client: The callable making the request on a cache miss. Defaults to the request client.
         """
 
         @wraps(wrapped_request)
@@ -210,7 +215,7 @@ async def cache_request(cache: AsyncCache) -> Callable:
                 logger.debug(f"Cache miss for {key}")
                 if delay is not None:
                     await asyncio.sleep(delay)
-                response = await request.client(request)
+                response = await (client or request.client)(request)
                 value = response.text, response.data
                 await cache.set(key, value)
                 return response
@@ -231,13 +236,13 @@ class CacheFactory:
         if not self.cache_config.use:
             logger.debug("Cache disabled")
             return nullcontext()
-        if self.cache_config.cache_type == "json":
+        if self.cache_config.cache_type == CacheType.JSON:
             logger.debug("Using local cache")
             cache = JsonCache(Path(self.cache_config.path))  # type: ignore
-        elif self.cache_config.cache_type == "pickle":
+        elif self.cache_config.cache_type == CacheType.PICKLE:
             logger.debug("Using pickle cache")
             cache = PickleCache(Path(self.cache_config.path))  # type: ignore
-        elif self.cache_config.cache_type == "remote":
+        elif self.cache_config.cache_type == CacheType.REMOTE:
             logger.debug("Using remote cache")
             cache = RemoteCache(  # type: ignore
                 save_state=self.cache_config.save_state,
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import re
 import warnings
 from abc import ABC
-from logging import getLogger
+from dataclasses import dataclass, field
+from logging import DEBUG, getLogger
 from typing import Annotated, Any, Awaitable, Callable, NoReturn, Optional, Sequence
 
 import httpx
@@ -51,6 +53,37 @@ except ImportError:
 
 logger = getLogger(__name__)
 
+RETRYABLE_STATUS_CODES = frozenset({403, 429})
+
+InterceptURL = str | re.Pattern | Sequence[str]
+
+
+def _compile_intercept_matcher(intercept_url: InterceptURL) -> Callable[[str], Any]:
+    """Compile the intercept URL into a callable that matches request URLs.
+
+    A string is matched as a substring of the URL, a compiled pattern is searched in the URL
+    and a sequence of strings is compiled into a single alternation regex.
+
+    :param intercept_url: The URL, URL pattern or sequence of URLs to intercept.
+    :return: A callable returning a truthy value if the URL should be intercepted.
+    :raises ValueError: If the sequence of URLs is empty.
+    """
+    if isinstance(intercept_url, re.Pattern):
+        return intercept_url.search
+    if isinstance(intercept_url, str):
+        return lambda url: intercept_url in url
+    if not intercept_url:
+        raise ValueError("intercept_url cannot be an empty sequence.")
+    return re.compile("|".join(re.escape(url) for url in intercept_url)).search
+
+
+@dataclass(slots=True)
+class _InterceptState:
+    """Responses intercepted while serving a single request."""
+
+    responses: list[PlaywrightResponse] = field(default_factory=list)
+    seen: set[tuple[str, str, bytes | None]] = field(default_factory=set)
+
 
 class BaseClient(ABC):
     """Base client class."""
@@ -77,7 +110,7 @@ class BaseClient(ABC):
         """
         if status_code == 200:
             return
-        elif 500 <= status_code < 600 or status_code in [429, 403]:
+        elif 500 <= status_code < 600 or status_code in RETRYABLE_STATUS_CODES:
             raise RetryableException(status_text, status_code=status_code)
         else:
             raise NonRetryableException(status_text, status_code=status_code)
@@ -102,6 +135,10 @@ class HttpXClient(BaseClient):
             logger.debug(f"HTTP Status Error making request: {e}")
             status_code: Annotated[int, Ge(400), Le(600)] = e.response.status_code
             self._raise_for_status(status_code, e.response.reason_phrase)
+            # _raise_for_status only returns on 200, which HTTPStatusError never carries
+            raise NonRetryableException(
+                e.response.reason_phrase, status_code=status_code
+            )
 
         except httpx.TimeoutException as e:
             msg = f"Timeout making request: {e}, {e.__class__.__name__}"
@@ -113,9 +150,7 @@ class HttpXClient(BaseClient):
             logger.debug(msg)
             raise DataServiceException(msg)
 
-        assert False, "Should not reach this point"
-
-    async def _get_response(self, request) -> Response:
+    async def _get_response(self, request: Request) -> Response:
         """Get the response from the request.
         :param request: The request object containing the details of the HTTP request.
         :return: A Response object containing the response data.
@@ -142,14 +177,15 @@ class HttpXClient(BaseClient):
                     data = None
                 case "json":
                     data = response.json()
-        msg = f"Received response for {request.url}"
-        if request.params:
-            msg += f" - params {request.params}"
-        if request.form_data:
-            msg += f" - form data {request.form_data}"
-        if request.json_data:
-            msg += f" - json data {request.json_data}"
-        logger.debug(msg)
+        if logger.isEnabledFor(DEBUG):
+            msg = f"Received response for {request.url}"
+            if request.params:
+                msg += f" - params {request.params}"
+            if request.form_data:
+                msg += f" - form data {request.form_data}"
+            if request.json_data:
+                msg += f" - json data {request.json_data}"
+            logger.debug(msg)
         return Response(
             request=request,
             text=response.text,
@@ -166,13 +202,14 @@ class PlaywrightClient(BaseClient):
         self,
         *,
         actions: Optional[Callable[[PlaywrightPage], Awaitable[None]]] = None,
-        intercept_url: Optional[str] = None,
+        intercept_url: Optional[InterceptURL] = None,
         config: PlaywrightConfig = PlaywrightConfig(),
     ):
         """Initialize the PlaywrightClient.
 
         :param actions: Optional coroutine with actions to perform on the page before returning the response.
         :param intercept_url: Optional URL to intercept and get data from.
+            Can be a substring of the URL, a compiled regex or a list of substrings.
         :param config: PlaywrightConfig object.
         """
         if not PLAYWRIGHT_AVAILABLE:
@@ -183,7 +220,11 @@ class PlaywrightClient(BaseClient):
         self.actions = actions
         self.intercept_url = intercept_url
         self.config = config
-        self._intercepted_requests: list[PlaywrightRequest] = []
+        self._intercept_matcher = (
+            _compile_intercept_matcher(intercept_url)
+            if intercept_url is not None
+            else None
+        )
 
         if self.intercept_url:
             warnings.warn(
@@ -238,35 +279,51 @@ class PlaywrightClient(BaseClient):
         await browser.close()
         await playwright.stop()
 
-    def _intercept_requests(self, request: PlaywrightRequest):
-        """Intercept requests and store the data.
+    def _intercept_responses(
+        self, response: PlaywrightResponse, state: _InterceptState
+    ):
+        """Intercept responses and store them, skipping requests that have already been seen.
+        Requests are told apart by method, URL and post data, so POST requests to a shared endpoint are all kept.
+
+        :param response: The response object to intercept.
+        :param state: The intercept state of the request being served.
+        """
+        url = response.url
+        matcher = self._intercept_matcher
+        if matcher is None or not matcher(url):
+            return
+        pw_request = response.request
+        # Keyed on the raw body, post_data raises on bodies that are not UTF-8
+        key = (pw_request.method, url, pw_request.post_data_buffer)
+        if key not in state.seen:
+            logger.debug(f"Intercepted response: {url}")
+            state.seen.add(key)
+            state.responses.append(response)
+
+    @staticmethod
+    async def _read_response_body(
+        response: PlaywrightResponse,
+    ) -> tuple[Any | None, str]:
+        """Read the body of an intercepted response.
 
-        :param request: The request object to intercept.
+        :param response: The intercepted response.
+        :return: A tuple of the JSON data, if the response is JSON, and the text otherwise.
         """
-        seen = set()
-        if self.intercept_url in request.url and request.url not in seen:
-            logger.debug(f"Intercepted request: {request.url}")
-            seen.add(request.url)
-            if self._intercepted_requests:
-                self._intercepted_requests.append(request)
-            else:
-                self._intercepted_requests = [request]
-
-    async def _get_intercepted_requests(self) -> dict[str, dict[str, Any]]:
-        """Get the responses from the intercepted requests.
-
-        :return: A dictionary containing the responses from the intercepted requests.
+        content_type = response.headers.get("content-type", "")
+        if "application/json" in content_type:
+            return await response.json(), ""
+        return None, await response.text()
+
+    async def _get_intercepted_requests(self, state: _InterceptState) -> dict[str, Any]:
+        """Get the data from the intercepted responses.
+
+        :param state: The intercept state of the request being served.
+        :return: A dictionary containing the data of the intercepted responses, keyed by URL.
         """
         responses = {}
-        if self._intercepted_requests:
-            for request in self._intercepted_requests:
-                if request.url not in responses:
-                    response = await request.response()
-                    content_type = response.headers.get("content-type", "")
-                    if "application/json" in content_type:
-                        responses[request.url] = await response.json()
-                    else:
-                        responses[request.url] = await response.text()
+        for response in state.responses:
+            data, text = await self._read_response_body(response)
+            responses[response.url] = data if data is not None else text
         return responses
 
     async def make_request(self, request: Request) -> Response:
@@ -275,8 +332,9 @@ class PlaywrightClient(BaseClient):
         """
         browser, context, page, playwright = await self._set_up(request, self.config)
 
+        state = _InterceptState()
         if self.intercept_url is not None:
-            page.on("request", lambda pw_request: self._intercept_requests(pw_request))
+            page.on("response", lambda r: self._intercept_responses(r, state))
 
         try:
             logger.debug(f"Requesting {request.url_encoded}")
@@ -290,9 +348,7 @@ class PlaywrightClient(BaseClient):
 
             text = await page.content()
             data = (
-                await self._get_intercepted_requests()
-                if self._intercepted_requests
-                else None
+                await self._get_intercepted_requests(state) if state.responses else None
             )
             cookies = await context.cookies()
 
@@ -328,7 +384,7 @@ class PlaywrightInterceptClient(PlaywrightClient):
     def __init__(
         self,
         *,
-        intercept_url: str,
+        intercept_url: InterceptURL,
         callback: CallbackType,
         return_html: bool = True,
         actions: Optional[Callable[[PlaywrightPage], Awaitable[None]]] = None,
@@ -337,6 +393,7 @@ class PlaywrightInterceptClient(PlaywrightClient):
         """Initialize the PlaywrightInterceptClient.
 
         :param intercept_url: The URL to intercept and get data from.
+            Can be a substring of the URL, a compiled regex or a list of substrings.
         :param callback: The callback function to process the intercepted response.
         :param return_html: Whether to return the HTML content of the page.
         :param actions: Optional coroutine with actions to perform on the page before returning the response.
@@ -350,9 +407,9 @@ class PlaywrightInterceptClient(PlaywrightClient):
         super().__init__(actions=actions, config=config)
 
         self.intercept_url = intercept_url
+        self._intercept_matcher = _compile_intercept_matcher(intercept_url)
         self.callback = callback
         self.return_html = return_html
-        self._intercepted_requests: list[PlaywrightRequest] = []
 
     async def make_request(self, request: Request) -> Sequence[Response]:  # type: ignore
         """Make a request and intercept Fetch/XHR responses.
@@ -363,7 +420,8 @@ class PlaywrightInterceptClient(PlaywrightClient):
         :raises RetryableRequestException: If a retryable HTTP error occurs.
         """
         browser, context, page, playwright = await self._set_up(request, self.config)
-        page.on("request", lambda pw_request: self._intercept_requests(pw_request))
+        state = _InterceptState()
+        page.on("response", lambda r: self._intercept_responses(r, state))
         responses = []
         try:
             logger.debug(f"Requesting {request.url_encoded}")
@@ -390,16 +448,10 @@ class PlaywrightInterceptClient(PlaywrightClient):
                 )
 
                 responses.append(html_response)
-            for pw_request in self._intercepted_requests:
-                pw_response = await pw_request.response()
-                data, text = None, ""
-                pw_response_headers = pw_response.headers
-                content_type = pw_response_headers.get("content-type", "")
-                if "application/json" in content_type:
-                    data = await pw_response.json()
-                else:
-                    text = await pw_response.text()
-                request = InterceptRequest(
+            for intercepted_response in state.responses:
+                pw_request = intercepted_response.request
+                data, text = await self._read_response_body(intercepted_response)
+                intercept_request = InterceptRequest(
                     parent=request,
                     url=pw_request.url,
                     headers=pw_request.headers,
@@ -409,12 +461,12 @@ class PlaywrightInterceptClient(PlaywrightClient):
                 )
                 responses.append(
                     InterceptResponse(
-                        request=request,
+                        request=intercept_request,
                         text=text,
                         data=data,
-                        url=HttpUrl(pw_response.url),
-                        status_code=pw_response.status,
-                        headers=pw_response.headers,
+                        url=HttpUrl(intercepted_response.url),
+                        status_code=intercepted_response.status,
+                        headers=intercepted_response.headers,
                     )
                 )
             return responses
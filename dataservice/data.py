@@ -4,14 +4,18 @@ from __future__ import annotations
 
 import sys
 from abc import ABC
-from typing import Any, Iterable
+from functools import cache
+from typing import Any, ClassVar, Iterable, Self
 
 if sys.version_info >= (3, 12):
     from typing import TypedDict
 else:
     from typing_extensions import TypedDict
 
-from pydantic import BaseModel, model_validator
+from pydantic import BaseModel, Field, TypeAdapter, model_validator
+
+# Exact types that are never callable, so their values can be stored without evaluation.
+_PLAIN_TYPES = frozenset({str, int, float, bool, bytes, type(None), list, dict, tuple})
 
 
 class DataError(TypedDict):
@@ -24,21 +28,49 @@ class DataError(TypedDict):
 class DataWrapper(dict):
     """Special type of dictionary that runs callables and stores exceptions.
     Values can be callables or any other type. Callables are evaluated when accessed.
-    If an exception occurs, the exception is stored in the `errors` dictionary."""
+    If an exception occurs, the exception is stored in the `errors` dictionary.
+
+    Set `error_messages` to False to record only the exception type and skip formatting
+    the message, which is cheaper when callables fail often. Callables are best kept to
+    raising exceptions with short messages."""
+
+    __slots__ = ("_errors",)
+
+    error_messages: ClassVar[bool] = True
 
     def __init__(self, mapping: dict | None = None, /, **kwargs):
-        self.errors: dict = {}
+        self._errors: dict | None = None
 
-        if mapping is not None:
-            for key, value in mapping.items():
-                mapping[key] = self._set_item(key, value)
-        else:
-            mapping = {}
+        set_item = self._set_item
+        items = [(key, set_item(key, value)) for key, value in (mapping or {}).items()]
         if kwargs:
-            for key, value in kwargs.items():
-                mapping[key] = self._set_item(key, value)
+            items.extend((key, set_item(key, value)) for key, value in kwargs.items())
+        dict.__init__(self, items)
+
+    @classmethod
+    def from_values(cls, mapping: dict, /) -> Self:
+        """Build a wrapper from already resolved values, skipping callable evaluation.
+
+        Values are stored as they are, so callables are kept rather than called.
 
-        super().__init__(mapping)
+        :param mapping: A dictionary of resolved values.
+        :return: A new DataWrapper with no errors.
+        """
+        wrapper = cls.__new__(cls)
+        wrapper._errors = None
+        dict.update(wrapper, mapping)
+        return wrapper
+
+    @property
+    def errors(self) -> dict[Any, DataError]:
+        """The errors raised by callables, keyed by the item key. Allocated on first access or error."""
+        if self._errors is None:
+            self._errors = {}
+        return self._errors
+
+    @errors.setter
+    def errors(self, errors: dict[Any, DataError]) -> None:
+        self._errors = errors
 
     def __setitem__(self, key: Any, value: Any):
         """Set attribute value, evaluating callables. If an exception occurs, store it in the exceptions dict.
@@ -46,19 +78,21 @@ class DataWrapper(dict):
         :param key: The key to set in the dictionary.
         :param value: The value to set in the dictionary.
         """
-        maybe_value = self._set_item(key, value)
-        super().__setitem__(key, maybe_value)
+        dict.__setitem__(self, key, self._set_item(key, value))
 
     def _set_item(self, key, value):
         """Set the value for the given key, evaluating callables."""
+        if type(value) in _PLAIN_TYPES:
+            return value
         maybe_value, maybe_exception = self.maybe(value)
         if maybe_exception:
-            self.errors[key] = DataError(
-                **{
-                    "type": type(maybe_exception).__name__,
-                    "message": str(maybe_exception),
-                }
-            )
+            error: DataError = {
+                "type": type(maybe_exception).__name__,
+                "message": str(maybe_exception) if self.error_messages else "",
+            }
+            if self._errors is None:
+                self._errors = {}
+            self._errors[key] = error
         return maybe_value
 
     @staticmethod
@@ -78,12 +112,17 @@ class DataWrapper(dict):
         :param value: The value to be evaluated. It can be a callable or any other type.
         :return: A tuple containing the evaluated value or None, and an exception or None.
         """
-        if callable(value):
-            try:
-                return value(), None
-            except Exception as e:
-                return None, e
-        return value, None
+        if type(value) in _PLAIN_TYPES:
+            return value, None
+        try:
+            return value(), None
+        except TypeError as e:
+            # Either `value` is not callable, or the callable itself raised a TypeError
+            if not callable(value):
+                return value, None
+            return None, e
+        except Exception as e:
+            return None, e
 
 
 class BaseDataItem(BaseModel):
@@ -106,14 +145,56 @@ class BaseDataItem(BaseModel):
         # {'data_callable': {'type': 'ZeroDivisionError', 'message': 'division by zero'}}
     """
 
-    errors: dict[Any, DataError] = {}
+    errors: dict[Any, DataError] = Field(default_factory=dict)
 
     @model_validator(mode="before")
     @classmethod
     def _run_callables(cls, data: Any) -> Any:
         """Wrap the data in a DataWrapper, i.e. evaluate callables and store errors if they occur."""
+        return cls._wrap_data(data)
+
+    @classmethod
+    def _wrap_data(cls, data: Any) -> DataWrapper:
+        """Evaluate the callables in the data and store the errors under `errors`.
+
+        Shared by the validator and `wrap`, as the decorated validator cannot be called directly.
+        """
         wrapped = DataWrapper(data)
-        return {**wrapped, "errors": wrapped.errors}
+        wrapped["errors"] = wrapped.errors
+        return wrapped
+
+    @classmethod
+    def wrap(cls, data: dict, /) -> Self:
+        """Evaluate callables and build the item without validation.
+
+        Faster than the constructor, but values are not validated or coerced,
+        so only use it with data you trust to match the model.
+
+        :param data: A dictionary whose values can be callables.
+        :return: The data item, with errors stored in `errors`.
+        """
+        return cls.model_construct(**cls._wrap_data(data))
+
+    @classmethod
+    def from_batch(cls, rows: Iterable[dict]) -> list[Self]:
+        """Validate many rows at once, amortizing the validation overhead across the batch.
+
+        :Example:
+
+        .. code-block:: python
+
+            items = MyDataItem.from_batch([{"data": 1, "data_callable": lambda: 1}])
+
+        :param rows: An iterable of dictionaries, whose values can be callables.
+        :return: A list of data items.
+        """
+        return _get_list_adapter(cls).validate_python(rows)
+
+
+@cache
+def _get_list_adapter(item_cls: type[BaseDataItem]) -> TypeAdapter:
+    """Return a cached TypeAdapter validating a list of `item_cls`."""
+    return TypeAdapter(list[item_cls])  # type: ignore[valid-type]
 
 
 class DataSink(ABC):
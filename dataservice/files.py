@@ -3,15 +3,44 @@
 import csv
 import json
 import logging
+from functools import partial
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
-from typing import Iterable, Iterator
+from typing import Any, Callable, Iterable, Iterator, Sequence
 
 from pydantic import BaseModel
 
 from dataservice.data import DataSink
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+WRITE_BUFFER_SIZE = 1 << 20
+INDENT = b" " * 2
+
+
+def _dumps(data: Any) -> bytes:
+    """Encode data as indented UTF-8 JSON, using orjson when it is installed.
+
+    Data orjson cannot encode, e.g. integers wider than 64 bits, is encoded by the json module instead.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False).encode()
+
 
 class FileWriter(DataSink):
     """Base class for file writers."""
@@ -25,14 +54,29 @@ class FileWriter(DataSink):
         :param results: An iterable of result items.
         :return: A list of dictionaries.
         """
+        dumpers: dict[type, Callable[[Any], dict]] = {}
+        last_type: type | None = None
+        dump: Callable[[Any], dict]
         for result in results:
-            if isinstance(result, BaseModel):
-                exclude = set()
-                if hasattr(result, "errors"):
-                    exclude = {"errors"}
-                yield result.model_dump(exclude=exclude)
-            else:
-                yield result
+            # Results are usually homogeneous, so only look up the dumper on a type change
+            if type(result) is not last_type:
+                last_type = type(result)
+                dump = dumpers.get(last_type) or dumpers.setdefault(
+                    last_type, self._get_dumper(last_type)
+                )
+            yield dump(result)
+
+    @staticmethod
+    def _get_dumper(result_type: type) -> Callable[[Any], dict]:
+        """Return the function converting items of the given type to a dictionary.
+
+        :param result_type: The type of the result items.
+        :return: A callable returning the data dictionary of an item.
+        """
+        if issubclass(result_type, BaseModel):
+            exclude = {"errors"} if "errors" in result_type.model_fields else set()
+            return partial(result_type.model_dump, exclude=exclude)
+        return lambda result: result
 
 
 class CSVWriter(FileWriter):
@@ -43,13 +87,49 @@ class CSVWriter(FileWriter):
 
         :param results_dicts: An iterable of data items.
         """
-        results_dicts: list[dict] = list(self.get_data_dicts(results))
-        with open(self.file_path, "w") as f:
-            writer = csv.DictWriter(f, fieldnames=results_dicts[0].keys())
-            writer.writeheader()
-            writer.writerows(results_dicts)
+        results_dicts = self.get_data_dicts(results)
+        first = next(results_dicts, None)
+        if first is None:
+            logger.warning(f"No data to write to {self.file_path}")
+            return
+        fieldnames = tuple(first)
+        with open(self.file_path, "w", buffering=WRITE_BUFFER_SIZE) as f:
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            writer.writerows(self._get_rows(chain((first,), results_dicts), fieldnames))
         logger.info(f"Data written to {self.file_path}")
 
+    @staticmethod
+    def _get_rows(
+        results_dicts: Iterator[dict], fieldnames: tuple[str, ...]
+    ) -> Iterator[Sequence[Any]]:
+        """Yield the values of each data dictionary in field order.
+
+        Rows with exactly the expected keys go through a single ``itemgetter``
+        call; anything else falls back to ``csv.DictWriter`` semantics.
+
+        :param results_dicts: An iterator of data dictionaries.
+        :param fieldnames: The CSV header.
+        :return: An iterator of rows.
+        """
+        fields = frozenset(fieldnames)
+        num_fields = len(fieldnames)
+        get = itemgetter(*fieldnames) if fieldnames else lambda row: ()
+        for row in results_dicts:
+            if len(row) == num_fields:
+                try:
+                    values = get(row)
+                except KeyError:
+                    pass
+                else:
+                    yield values if num_fields != 1 else (values,)
+                    continue
+            if extra := row.keys() - fields:
+                raise ValueError(
+                    f"dict contains fields not in fieldnames: {', '.join(map(repr, extra))}"
+                )
+            yield [row.get(key, "") for key in fieldnames]
+
 
 class JsonWriter(FileWriter):
     """Writes data to a JSON file."""
@@ -59,9 +139,16 @@ class JsonWriter(FileWriter):
 
         :param results: An iterable of data items.
         """
-        results = list(self.get_data_dicts(results))
-        with open(self.file_path, "w") as f:
-            json.dump(results, f, indent=4)
+        with open(self.file_path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(b"[")
+            separator = b"\n"
+            for data in self.get_data_dicts(results):
+                # Same layout as dumping the whole list, one item at a time
+                f.write(
+                    separator + INDENT + _dumps(data).replace(b"\n", b"\n" + INDENT)
+                )
+                separator = b",\n"
+            f.write(b"]" if separator == b"\n" else b"\n]")
         logger.info(f"Data written to {self.file_path}")
 
 
@@ -1,5 +1,7 @@
 """Logging module."""
 
+from copy import deepcopy
+from functools import cache
 from logging.config import dictConfig
 from typing import Literal
 
@@ -38,9 +40,22 @@ def setup_logging(logger_name: str | None = None, level: LoggingLevel = "DEBUG")
     :param logger_name: The logger name.
     :param level: The logging level.
     """
-    loggers = {"dataservice": LoggerDict(level=level)}
+    logger_config = _get_logger_config(level)
+    loggers = {"dataservice": logger_config}
     if logger_name is not None:
-        loggers.update({logger_name: LoggerDict(level=level)})
+        loggers[logger_name] = logger_config
 
-    dict_config = LoggingConfigDict(loggers=loggers).model_dump(by_alias=True)
-    dictConfig(dict_config)
+    # dictConfig consumes parts of the dict it is given, so pass it a copy of the cached defaults
+    dictConfig(deepcopy({**_get_base_config(), "loggers": loggers}))
+
+
+@cache
+def _get_base_config() -> dict:
+    """Return the default logging configuration, without loggers, validated once."""
+    return LoggingConfigDict(loggers={}).model_dump(by_alias=True)
+
+
+@cache
+def _get_logger_config(level: LoggingLevel) -> dict:
+    """Return the logger configuration for the given level, validated once."""
+    return LoggerDict(level=level).model_dump()
@@ -2,20 +2,24 @@
 
 from __future__ import annotations
 
+import logging
 import urllib.parse
+from functools import cache, cached_property
 from typing import (
+    TYPE_CHECKING,
     Annotated,
     Any,
     Awaitable,
     Callable,
     Iterator,
     Literal,
+    Mapping,
     Optional,
+    Self,
     TypedDict,
     Union,
 )
 
-from bs4 import BeautifulSoup
 from pydantic import (
     AfterValidator,
     BaseModel,
@@ -29,15 +33,62 @@ from pydantic import (
 from dataservice._utils import _get_func_name
 from dataservice.config import ProxyConfig
 
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
 GenericDataItem = dict[Any, Any] | BaseModel
 RequestOrData = Union["Request", GenericDataItem]
 CallbackReturn = Iterator[RequestOrData] | RequestOrData
 CallbackType = Callable[["Response"], CallbackReturn]
 ClientCallable = Callable[["Request"], Awaitable["Response"]]
 StrOrDict = str | dict
+HtmlParser = Literal["html5lib", "lxml", "html.parser"]
+
+logger = logging.getLogger(__name__)
+
+_MODEL_CONFIG = ConfigDict(
+    arbitrary_types_allowed=True, frozen=True, revalidate_instances="never"
+)
+
+
+@cache
+def _get_cached_property_names(model_cls: type[BaseModel]) -> tuple[str, ...]:
+    """Return the names of the cached properties of a model class, including inherited ones."""
+    return tuple(
+        {
+            name: None
+            for klass in model_cls.__mro__
+            for name, attr in vars(klass).items()
+            if isinstance(attr, cached_property)
+        }
+    )
+
+
+class _CachedPropertiesModel(BaseModel):
+    """Base class for models deriving values with `cached_property`.
+
+    Cached values live in the instance `__dict__`, which copies share, so they are dropped from copies:
+    `model_copy(update=...)` would otherwise return values computed from the original fields.
+    """
+
+    def _clear_cached_properties(self) -> Self:
+        for name in _get_cached_property_names(type(self)):
+            self.__dict__.pop(name, None)
+        return self
+
+    def __copy__(self) -> Self:
+        return super().__copy__()._clear_cached_properties()
 
+    def __deepcopy__(self, memo: dict[int, Any] | None = None) -> Self:
+        return super().__deepcopy__(memo)._clear_cached_properties()
 
-class Request(BaseModel):
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        return super().model_copy(update=update, deep=deep)._clear_cached_properties()
+
+
+class Request(_CachedPropertiesModel):
     """Request model."""
 
     url: Annotated[
@@ -76,8 +127,12 @@ class Request(BaseModel):
     timeout: int = Field(
         description="The time out of the request.", default=30, ge=1, le=300
     )
+    parser: HtmlParser = Field(
+        description="The BeautifulSoup parser used to build the response HTML.",
+        default="html5lib",
+    )
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    model_config = _MODEL_CONFIG
 
     @model_validator(mode="after")
     def validate(self) -> Request:  # type: ignore
@@ -89,25 +144,27 @@ class Request(BaseModel):
 
     @model_serializer
     def ser_model(self) -> dict[str, Any]:
-        model = {}
-        for key in self.model_fields.keys():
-            val = getattr(self, key)
-            if key in ("callback", "client"):
-                val = type(val).__name__
-            model[key] = val
+        values = self.__dict__
+        model = {key: values[key] for key in _get_field_names(type(self))}
+        model["callback"] = type(model["callback"]).__name__
+        model["client"] = type(model["client"]).__name__
         return model
 
-    @property
+    @cached_property
     def callback_name(self) -> str:
         return _get_func_name(self.callback)
 
-    @property
+    @cached_property
     def client_name(self) -> str:
         return _get_func_name(self.client)
 
-    @property
+    def __hash__(self) -> int:
+        """Hash the request by its unique key, so equal requests hash equally."""
+        return hash(self.unique_key)
+
+    @cached_property
     def unique_key(self) -> str:
-        """Return a unique key for the request."""
+        """Return a unique key for the request, computed on first access."""
         key = f"{self.method} {self.url}"
         if self.params:
             key += f" {self.params}"
@@ -117,9 +174,9 @@ class Request(BaseModel):
             key += f" {self.json_data}"
         return key
 
-    @property
+    @cached_property
     def url_encoded(self) -> HttpUrl:
-        """Return the URL encoded."""
+        """Return the URL encoded, built and validated on first access."""
         url = str(self.url)
         if "?" in url or not self.params:
             return HttpUrl(url)
@@ -129,6 +186,12 @@ class Request(BaseModel):
         return HttpUrl(f"{url}?{urllib.parse.urlencode(self.params)}")  # type: ignore
 
 
+@cache
+def _get_field_names(model_cls: type[BaseModel]) -> tuple[str, ...]:
+    """Return the field names of a model class, in definition order."""
+    return tuple(model_cls.model_fields)
+
+
 class InterceptRequest(Request):
     """Intercept request model."""
 
@@ -142,7 +205,7 @@ class InterceptRequest(Request):
     )
 
 
-class Response(BaseModel):
+class Response(_CachedPropertiesModel):
     """Response model."""
 
     request: Request = Field(description="The request that generated the response.")
@@ -162,24 +225,31 @@ class Response(BaseModel):
     data: dict | list[dict] | None = Field(
         description="The data of the response.", default=None
     )
-    __html: BeautifulSoup | None = None
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    model_config = _MODEL_CONFIG
 
     @property
     def client(self) -> ClientCallable:
         return self.request.client
 
-    @property
+    @cached_property
     def html(self) -> BeautifulSoup:
-        """Return the BeautifulSoup object of the response, if the initial request asked for text data."""
+        """Return the BeautifulSoup object of the response, if the initial request asked for text data.
+        The document is parsed on first access only."""
         if self.request.content_type == "json":
             raise ValueError(
                 "Cannot create BeautifulSoup object when the Request content type is JSON."
             )
-        if self.__html is None:
-            self.__html = BeautifulSoup(self.text, "html5lib")
-        return self.__html
+        # Imported here so that JSON-only workloads never load bs4 and its parsers
+        from bs4 import BeautifulSoup, FeatureNotFound
+
+        try:
+            return BeautifulSoup(self.text, self.request.parser)
+        except FeatureNotFound:
+            logger.warning(
+                f"Parser {self.request.parser} is not installed, falling back to html5lib."
+            )
+            return BeautifulSoup(self.text, "html5lib")
 
 
 class InterceptResponse(Response):
@@ -7,7 +7,9 @@ from __future__ import annotations
 import asyncio
 import pathlib
 import signal
+import warnings
 from abc import ABC
+from contextlib import suppress
 from logging import getLogger
 from typing import AsyncIterator, Iterable, Iterator
 
@@ -32,6 +34,7 @@ class BaseDataService(ABC):
         self.config: ServiceConfig = config
         self.cache_factory = CacheFactory(config.cache)
         self._data_worker: DataWorker | None = None
+        self._fetch_task: asyncio.Task | None = None
 
     @property
     def data_worker(self) -> DataWorker:
@@ -48,22 +51,37 @@ class BaseDataService(ABC):
                 requests=self._requests, config=self.config, cache=cache
             )
 
-    def register_signal_handlers(self):
-        """Register signal handlers for SIGINT and SIGTERM."""
-        loop = asyncio.get_running_loop()
+    def register_signal_handlers(
+        self, loop: asyncio.AbstractEventLoop | None = None
+    ) -> None:
+        """
+        Register signal handlers for SIGINT and SIGTERM.
+
+        :param loop: The event loop to register them on. Defaults to the running loop.
+        """
+        loop = loop or asyncio.get_running_loop()
         loop.add_signal_handler(signal.SIGINT, self._handle_stop_signal)
         loop.add_signal_handler(signal.SIGTERM, self._handle_stop_signal)
         logger.info("Signal handlers registered for SIGINT and SIGTERM.")
 
     def _handle_stop_signal(self):
-        """Set the stop event when a termination signal is received."""
+        """
+        Stop the data worker when a termination signal is received.
+        Only the data worker is cancelled, so the iteration ends with the data items fetched so far.
+        """
         logger.info("Received stop signal. Cancelling remaining tasks.")
-        for task in asyncio.all_tasks():
-            task.cancel()
+        if self._fetch_task is not None:
+            self._fetch_task.cancel()
 
-    def cleanup_signal_handlers(self):
-        """Remove signal handlers."""
-        loop = asyncio.get_running_loop()
+    def cleanup_signal_handlers(
+        self, loop: asyncio.AbstractEventLoop | None = None
+    ) -> None:
+        """
+        Remove signal handlers.
+
+        :param loop: The event loop to remove them from. Defaults to the running loop.
+        """
+        loop = loop or asyncio.get_running_loop()
         loop.remove_signal_handler(signal.SIGINT)
         loop.remove_signal_handler(signal.SIGTERM)
         logger.info("Signal handlers cleaned up.")
@@ -79,6 +97,48 @@ class BaseDataService(ABC):
             finally:
                 self.cleanup_signal_handlers()
 
+    async def _next_data_item(self) -> GenericDataItem:
+        """
+        Returns the next data item, starting the data worker in the background on the first call.
+        Items are returned as soon as they are produced, while the worker keeps fetching.
+
+        :raises StopAsyncIteration: When the worker has finished and all data items have been returned.
+        """
+        if self._fetch_task is None:
+            await self._init_data_worker()
+            logger.info("Start fetching.")
+            self._fetch_task = self._create_fetch_task()
+        while self.data_worker.has_no_more_data():
+            if self._fetch_task.done():
+                # A closed service stops iterating, otherwise surface any error raised by the worker
+                if not self._fetch_task.cancelled():
+                    self._fetch_task.result()
+                raise StopAsyncIteration
+            getter = asyncio.create_task(self.data_worker.next_data_item())
+            try:
+                await asyncio.wait(
+                    (getter, self._fetch_task), return_when=asyncio.FIRST_COMPLETED
+                )
+            finally:
+                if not getter.done():
+                    getter.cancel()
+            if getter.done() and not getter.cancelled():
+                return getter.result()
+        return self.data_worker.get_data_item()
+
+    def _create_fetch_task(self) -> asyncio.Task:
+        """Starts the data worker in the background."""
+        return asyncio.create_task(self._run_data_worker())
+
+    async def _cancel_fetch_task(self) -> None:
+        """Cancels the data worker if it is still fetching, and waits for it to stop."""
+        task = self._fetch_task
+        if task is None or task.done():
+            return
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
     def get_failures(self) -> dict[str, FailedRequest]:
         """
         Returns a dict of failed requests.
@@ -105,8 +165,8 @@ class BaseDataService(ABC):
 class DataService(BaseDataService):
     """
     A service class to handle data requests and processing.
-    This is the synchronous version of the data service. It will run the data worker in the main thread
-    and block until all data items are fetched.
+    This is the synchronous version of the data service. It runs the data worker on an event loop owned by the
+    service, which is driven by each call to ``next`` until a data item is available.
 
     :Example:
         .. code-block:: python
@@ -127,34 +187,96 @@ class DataService(BaseDataService):
                 print(data_item)
     """
 
+    def __init__(
+        self, requests: Iterable[Request], config: ServiceConfig = ServiceConfig()
+    ):
+        super().__init__(requests, config)
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def __enter__(self) -> DataService:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        if getattr(self, "_loop", None) is not None:
+            warnings.warn(
+                f"Unclosed {type(self).__name__}. Call close(), or use the service as a context manager, "
+                "when leaving an iteration early.",
+                ResourceWarning,
+                source=self,
+            )
+
     def __iter__(self) -> Iterator[GenericDataItem]:
         """
         Returns the iterator object itself.
         """
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
         return self
 
     def __next__(self) -> GenericDataItem:
         """
         Fetches the next data item from the data worker.
         """
-        self._init_data_worker_sync()
-        if not self.data_worker.has_started:
-            logger.info("Start fetching.")
-            self._run_data_worker_sync()
-            logger.info("Retrieving data.")
-        if self.data_worker.has_no_more_data():
-            raise StopIteration
-        return self.data_worker.get_data_item()
-
-    def _init_data_worker_sync(self) -> None:
-        """Wrapper for the async init_data_worker method."""
-        asyncio.run(self._init_data_worker())
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        loop = self._loop
+        try:
+            # The cache registers its own signal handlers, so the service's are registered after it
+            if self._data_worker is None:
+                loop.run_until_complete(self._init_data_worker())
+            # Signals stop the data worker while the loop runs, and are raised in the caller as usual otherwise
+            self.register_signal_handlers(loop)
+            try:
+                return loop.run_until_complete(self._next_data_item())
+            finally:
+                self.cleanup_signal_handlers(loop)
+        except StopAsyncIteration:
+            self._close_loop()
+            raise StopIteration from None
+        except BaseException:
+            # Including interrupts, so the worker is stopped and the cache flushed before they propagate
+            self._close_loop()
+            raise
+
+    def _create_fetch_task(self) -> asyncio.Task:
+        """
+        Starts the data worker in the background.
+        Signal handlers are registered by ``next`` while the loop runs, rather than by the task.
+        """
+        return asyncio.create_task(self.data_worker.fetch())
 
-    def _run_data_worker_sync(self) -> None:
+    def close(self) -> None:
         """
-        Runs the data worker to fetch data items.
+        Stops the data worker if it is still fetching and closes the event loop owned by the service.
+        Call it, or use the service as a context manager, when leaving an iteration early.
         """
-        asyncio.run(self._run_data_worker())
+        self._close_loop()
+
+    def _close_loop(self) -> None:
+        """Cancels the tasks left on the event loop owned by the service, i.e. the data worker, then closes it."""
+        loop = self._loop
+        if loop is None:
+            return
+        try:
+            # The fetch task and the worker tasks are all cancelled before the loop runs again,
+            # so none of them takes another step, e.g. scheduling callbacks at interpreter exit
+            if self._data_worker is not None:
+                self._data_worker.cancel_pending_tasks()
+            tasks = asyncio.all_tasks(loop)
+            if self._fetch_task is not None and not self._fetch_task.done():
+                # all_tasks may come back empty at interpreter exit
+                tasks.add(self._fetch_task)
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            loop.close()
+            self._loop = None
 
 
 class AsyncDataService(BaseDataService):
@@ -183,17 +305,24 @@ class AsyncDataService(BaseDataService):
             asyncio.run(main())
     """
 
+    async def __aenter__(self) -> AsyncDataService:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Stops the data worker if it is still fetching.
+        Call it, or use the service as an async context manager, when leaving an iteration early,
+        otherwise the worker keeps crawling in the background.
+        """
+        await self._cancel_fetch_task()
+
     def __aiter__(self) -> AsyncIterator[GenericDataItem]:
         """Returns the asynchronous iterator object itself."""
         return self
 
     async def __anext__(self) -> GenericDataItem:
         """Fetches the next data item from the data worker."""
-        await self._init_data_worker()
-        if not self.data_worker.has_started:
-            logger.info("Start fetching.")
-            await self._run_data_worker()
-            logger.info("Retrieving data.")
-        if self.data_worker.has_no_more_data():
-            raise StopAsyncIteration
-        return self.data_worker.get_data_item()
+        return await self._next_data_item()
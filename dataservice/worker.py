@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
 from collections import abc
 from contextlib import nullcontext
-from typing import Any, AsyncGenerator, Generator, Iterable
+from functools import cache
+from typing import Any, AsyncGenerator, Callable, Generator, Iterable
 
 from aiolimiter import AsyncLimiter
 from pydantic import BaseModel
@@ -19,7 +21,7 @@ from tenacity import (
 )
 
 from dataservice.cache import AsyncCache, cache_request
-from dataservice.config import ServiceConfig
+from dataservice.config import RetryConfig, ServiceConfig
 from dataservice.exceptions import (
     DataServiceException,
     NonRetryableException,
@@ -37,13 +39,65 @@ from dataservice.models import (
 logger = logging.getLogger(__name__)
 
 
+@cache
+def _get_retry_options(retry: RetryConfig) -> dict[str, Any]:
+    """Return the retry strategies for a retry configuration, built once per configuration."""
+    return {
+        "reraise": True,
+        "stop": stop_after_attempt(retry.max_attempts),
+        "wait": wait_exponential(
+            multiplier=retry.wait_exp_mul,
+            min=retry.wait_exp_min,
+            max=retry.wait_exp_max,
+        ),
+        "retry": retry_if_exception_type((RetryableException, TimeoutException)),
+        "before_sleep": _log_before_sleep,
+        "after": _log_after_attempt,
+    }
+
+
+def _fingerprint(key: str) -> int:
+    """Return a 128-bit fingerprint of a request key.
+
+    Seen requests are stored as fingerprints rather than full keys to bound memory on large crawls;
+    at 128 bits a collision is not a practical concern.
+    """
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=16).digest())
+
+
+@cache
+def _get_callback_handler(
+    callback_type: type,
+) -> Callable[[DataWorker, Any], AsyncGenerator[asyncio.Task, None]] | None:
+    """Return the handler for a callback result type, so the ABC checks run once per type rather than once per result."""
+    if issubclass(callback_type, abc.Generator):
+        return DataWorker._iter_generator
+    if issubclass(callback_type, abc.AsyncGenerator):
+        return DataWorker._iter_async_generator
+    if issubclass(callback_type, (Request, abc.MutableMapping, BaseModel)):
+        return DataWorker._iter_item
+    return None
+
+
+def _log_before_sleep(retry_state: RetryCallState) -> None:
+    """Log that the request passed to the retryer is about to be retried."""
+    logger.debug(
+        f"Retrying request {retry_state.args[0].url}, attempt {retry_state.attempt_number}",
+    )
+
+
+def _log_after_attempt(retry_state: RetryCallState) -> None:
+    """Log the outcome of a failed attempt of the request passed to the retryer."""
+    logger.debug(
+        f"Retry attempt {retry_state.attempt_number}. Request {retry_state.args[0].url} returned with status {retry_state.outcome}",
+    )
+
+
 class DataWorker:
     """
     A worker class to handle asynchronous data processing.
     """
 
-    _clients: dict[Any, Any] = {}
-
     def __init__(
         self,
         requests: Iterable[Request],
@@ -62,8 +116,9 @@ class DataWorker:
         self._data_queue: asyncio.Queue = asyncio.Queue()
         self._work_queue: asyncio.Queue = asyncio.Queue()
         self._failures: dict[str, FailedRequest] = {}
-        self._seen_requests: set = set()
+        self._seen_requests: set[int] = set()
         self._started: bool = False
+        self._pending_tasks: set[asyncio.Task] = set()
         self._semaphore: asyncio.Semaphore = asyncio.Semaphore(
             self.config.max_concurrency
         )
@@ -115,6 +170,14 @@ class DataWorker:
         """
         return self._data_queue.get_nowait()
 
+    async def next_data_item(self) -> GenericDataItem:
+        """
+        Wait for the next data item from the data queue.
+
+        :return: The data item.
+        """
+        return await self._data_queue.get()
+
     def has_no_more_data(self) -> bool:
         """
         Check if there are no more data items in the data queue.
@@ -131,6 +194,13 @@ class DataWorker:
         """
         return not self._work_queue.empty()
 
+    def cancel_pending_tasks(self) -> None:
+        """
+        Cancel the tasks in flight, e.g. when the service is closed before fetching has finished.
+        """
+        for task in self._pending_tasks:
+            task.cancel()
+
     def get_failures(self) -> dict[str, FailedRequest]:
         """
         Return a dictionary of failed requests.
@@ -175,13 +245,26 @@ class DataWorker:
         :param request: The request to check for duplication.
         :return: True if the request is a duplicate, False otherwise.
         """
-        key = request.unique_key
+        key = _fingerprint(request.unique_key)
         if key in self._seen_requests:
             logger.debug(f"Skipping duplicate request {request.url}")
             return True
         self._seen_requests.add(key)
         return False
 
+    def _skip_item(self, item: Request | GenericDataItem) -> bool:
+        """
+        Checks if an item should be dropped before a task is created for it, i.e. it is a duplicate request.
+
+        :param item: The item taken from a callback result.
+        :return: True if the item should be skipped, False otherwise.
+        """
+        return (
+            self.config.deduplication
+            and isinstance(item, Request)
+            and self._is_duplicate_request(item)
+        )
+
     def _has_request_failed(self, request: Request) -> bool:
         """
         Checks if a request has failed.
@@ -197,8 +280,6 @@ class DataWorker:
 
         :param request: The request item to handle.
         """
-        if self.config.deduplication and self._is_duplicate_request(request):
-            return
         if self._has_request_failed(request):
             logger.debug(f"Skipping failed request {request.url}")
             return
@@ -270,46 +351,9 @@ class DataWorker:
         :param request: The request object.
         :return: The response object.
         """
-
-        async def _wrap_retry(req: Request):
-            """
-            Wraps the request in a retry mechanism.
-
-            :param req: The request object.
-            :return: The response object.
-            """
-
-            def before_sleep_log(_logger):
-                def _before_sleep_log(retry_state: RetryCallState):
-                    _logger.debug(
-                        f"Retrying request {req.url}, attempt {retry_state.attempt_number}",
-                    )
-
-                return _before_sleep_log
-
-            def after_log(_logger):
-                def _after_log(retry_state: RetryCallState):
-                    _logger.debug(
-                        f"Retry attempt {retry_state.attempt_number}. Request {req.url} returned with status {retry_state.outcome}",
-                    )
-
-                return _after_log
-
-            retryer = AsyncRetrying(
-                reraise=True,
-                stop=stop_after_attempt(self.config.retry.max_attempts),
-                wait=wait_exponential(
-                    multiplier=self.config.retry.wait_exp_mul,
-                    min=self.config.retry.wait_exp_min,
-                    max=self.config.retry.wait_exp_max,
-                ),
-                retry=retry_if_exception_type((RetryableException, TimeoutException)),
-                before_sleep=before_sleep_log(logger),
-                after=after_log(logger),
-            )
-            return await retryer(self._make_request, req)
-
-        return await _wrap_retry(request)
+        # Retry state lives on the retryer, so each request needs its own; the strategies are shared
+        retryer = AsyncRetrying(**_get_retry_options(self.config.retry))
+        return await retryer(self._make_request, request)
 
     async def _make_request(self, request) -> Response:
         """
@@ -320,7 +364,17 @@ class DataWorker:
         """
         if self.config.cache.use:
             cached = await cache_request(self.cache)  # type: ignore
-            return await cached(request, self.config.delay.get())
+            # Cache hits are served directly, misses share the concurrency and rate limits and the delay
+            return await cached(request, client=self._call_client)
+        return await self._call_client(request)
+
+    async def _call_client(self, request: Request) -> Response:
+        """
+        Calls the request client after the configured delay, within the concurrency and rate limits.
+
+        :param request: The request object.
+        :return: The response object.
+        """
         async with self._semaphore, self._limiter:
             await asyncio.sleep(self.config.delay.get())
             return await request.client(request)
@@ -334,16 +388,49 @@ class DataWorker:
         :param callback: Either a callback iterator or a single result
         :return: An async generator of tasks.
         """
-        if isinstance(callback, abc.Generator):
-            for item in callback:
+        handler = _get_callback_handler(type(callback))
+        if handler is None:
+            raise ValueError(f"Unknown item type {type(callback)}")
+        async for task in handler(self, callback):
+            yield task
+
+    async def _iter_generator(
+        self, callback: Generator
+    ) -> AsyncGenerator[asyncio.Task, None]:
+        """
+        Creates tasks for the items of a callback generator.
+
+        :param callback: The callback generator.
+        :return: An async generator of tasks.
+        """
+        for item in callback:
+            if not self._skip_item(item):
                 yield asyncio.create_task(self._handle_queue_item(item))
-        elif isinstance(callback, abc.AsyncGenerator):
-            async for item in callback:
+
+    async def _iter_async_generator(
+        self, callback: AsyncGenerator
+    ) -> AsyncGenerator[asyncio.Task, None]:
+        """
+        Creates tasks for the items of a callback async generator.
+
+        :param callback: The callback async generator.
+        :return: An async generator of tasks.
+        """
+        async for item in callback:
+            if not self._skip_item(item):
                 yield asyncio.create_task(self._handle_queue_item(item))
-        elif isinstance(callback, (Request, abc.MutableMapping, BaseModel)):
+
+    async def _iter_item(
+        self, callback: Request | GenericDataItem
+    ) -> AsyncGenerator[asyncio.Task, None]:
+        """
+        Creates a task for a single callback result.
+
+        :param callback: The callback result.
+        :return: An async generator of tasks.
+        """
+        if not self._skip_item(callback):
             yield asyncio.create_task(self._handle_queue_item(callback))
-        else:
-            raise ValueError(f"Unknown item type {type(callback)}")
 
     async def fetch(self) -> None:
         """
@@ -352,28 +439,39 @@ class DataWorker:
         if not self._started:
             await self._enqueue_start_requests()
         async with self.cache as cache:
-            while self.has_jobs():
-                logger.debug(f"Work queue size: {self._work_queue.qsize()}")
-                logger.debug(f"Data queue size: {self._data_queue.qsize()}")
-                items = []
-                for _ in range(
-                    min(self.config.max_concurrency, self._work_queue.qsize())
-                ):
-                    items.append(self._work_queue.get_nowait())
-
-                tasks = []
-                for item in items:
-                    async for task in self._iter_callbacks(item):
-                        tasks.append(task)
-
-                        # Process batch when it reaches the max concurrency limit
-                        if len(tasks) >= self.config.max_concurrency:
-                            await asyncio.gather(*tasks)
-                            tasks = []
-
-                # Process any remaining tasks that didn’t fill a full batch
-                if tasks:
-                    await asyncio.gather(*tasks)
-
-                if self.config.cache.use and self.config.cache.write_periodically:
-                    await cache.write_periodically(self.config.cache.write_interval)
+            # Tasks of the work item being scheduled. A callback can yield many requests at once,
+            # so it is only resumed while there is room for more tasks in flight.
+            callbacks: AsyncGenerator[asyncio.Task, None] | None = None
+            try:
+                while self.has_jobs() or self._pending_tasks or callbacks is not None:
+                    logger.debug(f"Work queue size: {self._work_queue.qsize()}")
+                    logger.debug(f"Data queue size: {self._data_queue.qsize()}")
+                    # Top up the in-flight tasks as soon as any finish, instead of waiting for a whole batch
+                    while len(self._pending_tasks) < self.config.max_concurrency:
+                        if callbacks is None:
+                            if not self.has_jobs():
+                                break
+                            callbacks = self._iter_callbacks(
+                                self._work_queue.get_nowait()
+                            )
+                        task = await anext(callbacks, None)
+                        if task is None:
+                            callbacks = None
+                        else:
+                            self._pending_tasks.add(task)
+                    if not self._pending_tasks:
+                        continue
+                    done, self._pending_tasks = await asyncio.wait(
+                        self._pending_tasks, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        task.result()
+
+                    if self.config.cache.use and self.config.cache.write_periodically:
+                        await cache.write_periodically(self.config.cache.write_interval)
+            finally:
+                self.cancel_pending_tasks()
+                if self._pending_tasks:
+                    await asyncio.wait(self._pending_tasks)
+                if callbacks is not None:
+                    await callbacks.aclose()
@@ -196,3 +196,13 @@ async def test_cache_factory_init_remote_cache(mocker):
     cache = await factory.init_cache()
     assert isinstance(cache, RemoteCache)
     assert await cache.get("key") == "value"
+
+
+@pytest.mark.asyncio
+async def test_cache_factory_init_cache_from_copied_config(tmp_path):
+    cache_config = CacheConfig(path=tmp_path / "cache.json", use=True).model_copy(
+        update={"cache_type": "pickle", "path": tmp_path / "cache.pkl"}
+    )
+    factory = CacheFactory(cache_config)
+    cache = await factory.init_cache()
+    assert isinstance(cache, PickleCache)
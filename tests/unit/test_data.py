@@ -28,6 +28,13 @@ def test_maybe_callable_raises_exception():
     assert isinstance(exception, ValueError)
 
 
+def test_maybe_callable_raises_type_error():
+    d = DataWrapper()
+    value, exception = d.maybe(lambda: int(None))
+    assert value is None
+    assert isinstance(exception, TypeError)
+
+
 def test_maybe_non_callable_value():
     d = DataWrapper()
     value, exception = d.maybe(1)
@@ -53,6 +60,66 @@ def test_datawrapper_init_dict():
     }
 
 
+def test_datawrapper_init_does_not_mutate_mapping():
+    func = lambda: 1  # noqa
+    mapping = {"a": func}
+    d = DataWrapper(mapping, b=2)
+    assert d == {"a": 1, "b": 2}
+    assert mapping == {"a": func}
+
+
+@pytest.mark.parametrize("value", ["a", 1, 1.0, True, b"a", None, [1], {"a": 1}, (1,)])
+def test_datawrapper_plain_values(value):
+    d = DataWrapper(a=value)
+    assert d["a"] == value
+    assert d.errors == {}
+
+
+def test_datawrapper_has_no_instance_dict():
+    d = DataWrapper(a=1)
+    assert not hasattr(d, "__dict__")
+
+
+def test_datawrapper_errors_allocated_lazily():
+    d = DataWrapper(a=lambda: 1)
+    assert d._errors is None
+    d.errors["b"] = {"type": "ValueError", "message": "error"}
+    assert d.errors == {"b": {"type": "ValueError", "message": "error"}}
+
+
+def test_datawrapper_errors_setter():
+    d = DataWrapper(a=lambda: 1 / 0)
+    d.errors = {}
+    assert d.errors == {}
+
+
+def test_datawrapper_error_messages_disabled(mocker):
+    class Message(ValueError):
+        def __str__(self):
+            raise AssertionError("message should not be formatted")
+
+    def fail():
+        raise Message
+
+    mocker.patch.object(DataWrapper, "error_messages", False)
+    d = DataWrapper(a=fail, b=1)
+    assert d == {"a": None, "b": 1}
+    assert d.errors == {"a": {"type": "Message", "message": ""}}
+
+
+def test_datawrapper_from_values():
+    func = lambda: 1  # noqa
+    mapping = {"a": 1, "b": func}
+    d = DataWrapper.from_values(mapping)
+    assert type(d) is DataWrapper
+    assert d == {"a": 1, "b": func}
+    assert d.errors == {}
+    d["c"] = lambda: 1 / 0
+    assert d["c"] is None
+    assert d.errors["c"]["type"] == "ZeroDivisionError"
+    assert mapping == {"a": 1, "b": func}
+
+
 def test_datawrapper_is_instance_of_dict():
     d = DataWrapper(a=lambda: 1, **{"b": lambda: 1 / 0})
     assert isinstance(d, abc.MutableMapping)
@@ -84,3 +151,31 @@ def test_item_data_init_kwargs():
     assert item.errors == {
         "bar": {"type": "ZeroDivisionError", "message": "division by zero"}
     }
+
+
+def test_data_item_from_batch():
+    items = MockItem.from_batch(
+        [{"foo": 1, "bar": lambda: 2}, {"foo": lambda: 1 / 0, "bar": None}]
+    )
+    assert [(item.foo, item.bar) for item in items] == [(1, 2), (None, None)]
+    assert items[0].errors == {}
+    assert items[1].errors == {
+        "foo": {"type": "ZeroDivisionError", "message": "division by zero"}
+    }
+
+
+def test_data_item_wrap():
+    item = MockItem.wrap({"foo": lambda: 1, "bar": lambda: 1 / 0})
+    assert isinstance(item, MockItem)
+    assert item.foo == 1
+    assert item.bar is None
+    assert item.errors == {
+        "bar": {"type": "ZeroDivisionError", "message": "division by zero"}
+    }
+    assert MockItem.wrap({"foo": 1, "bar": 2}).errors == {}
+
+
+def test_data_item_errors_key_is_overwritten():
+    errors = {"foo": {"type": "ValueError", "message": "user"}}
+    assert MockItem(foo=1, bar=2, errors=errors).errors == {}
+    assert MockItem.wrap({"foo": 1, "bar": 2, "errors": errors}).errors == {}
@@ -0,0 +1,163 @@
+import csv
+import json
+
+import pytest
+from pydantic import BaseModel
+
+from dataservice import files
+from dataservice.data import BaseDataItem
+from dataservice.files import CSVWriter, FileWriter, JsonWriter
+
+
+class MockItem(BaseDataItem):
+    foo: int | None
+    bar: str | None
+
+
+class MockModel(BaseModel):
+    foo: int
+    bar: str
+
+
+@pytest.fixture
+def results():
+    return [
+        {"foo": 1, "bar": "a"},
+        MockItem(foo=2, bar="b"),
+        MockModel(foo=3, bar="c"),
+        MockItem(foo=lambda: 1 / 0, bar="d"),
+    ]
+
+
+def test_get_data_dicts(tmp_path, results):
+    writer = FileWriter(tmp_path / "data.json")
+    assert list(writer.get_data_dicts(results)) == [
+        {"foo": 1, "bar": "a"},
+        {"foo": 2, "bar": "b"},
+        {"foo": 3, "bar": "c"},
+        {"foo": None, "bar": "d"},
+    ]
+
+
+def test_get_data_dicts_resolves_dumper_per_type(tmp_path, mocker, results):
+    writer = FileWriter(tmp_path / "data.json")
+    spy = mocker.spy(FileWriter, "_get_dumper")
+    list(writer.get_data_dicts(results + results))
+    assert [call.args[0] for call in spy.call_args_list] == [dict, MockItem, MockModel]
+
+
+def test_json_writer(tmp_path, results):
+    file_path = tmp_path / "data.json"
+    JsonWriter(file_path).write(results)
+    with open(file_path) as f:
+        assert json.load(f) == [
+            {"foo": 1, "bar": "a"},
+            {"foo": 2, "bar": "b"},
+            {"foo": 3, "bar": "c"},
+            {"foo": None, "bar": "d"},
+        ]
+
+
+@pytest.mark.parametrize("orjson_available", [True, False])
+@pytest.mark.parametrize(
+    "data", [[], [{}], [{"a": [1, {"b": "x\ny"}]}, {"c": None, "d": "caffè"}]]
+)
+def test_json_writer_matches_json_dump(tmp_path, mocker, data, orjson_available):
+    if orjson_available and not files.ORJSON_AVAILABLE:
+        pytest.skip("orjson is not installed")
+    mocker.patch.object(files, "ORJSON_AVAILABLE", orjson_available)
+    file_path = tmp_path / "data.json"
+    JsonWriter(file_path).write(data)
+    with open(file_path, encoding="utf-8") as f:
+        assert f.read() == json.dumps(data, indent=2, ensure_ascii=False)
+
+
+@pytest.mark.parametrize(
+    "orjson_available, expected, float_text",
+    [
+        (True, [None, None, None, 10**20, 1e16], '"float": 1e16'),
+        (
+            False,
+            [float("nan"), float("inf"), float("-inf"), 10**20, 1e16],
+            '"float": 1e+16',
+        ),
+    ],
+)
+def test_json_writer_encoder_differences(
+    tmp_path, mocker, orjson_available, expected, float_text
+):
+    if orjson_available and not files.ORJSON_AVAILABLE:
+        pytest.skip("orjson is not installed")
+    mocker.patch.object(files, "ORJSON_AVAILABLE", orjson_available)
+    data = [
+        {"nan": float("nan"), "inf": float("inf"), "-inf": float("-inf")},
+        {"big": 10**20},
+        {"float": 1e16},
+    ]
+    file_path = tmp_path / "data.json"
+    JsonWriter(file_path).write(data)
+    with open(file_path, encoding="utf-8") as f:
+        text = f.read()
+    assert float_text in text
+    written = json.loads(text)
+    values = [*written[0].values(), written[1]["big"], written[2]["float"]]
+    assert repr(values) == repr(expected)
+
+
+def test_csv_writer(tmp_path, results):
+    file_path = tmp_path / "data.csv"
+    CSVWriter(file_path).write(results)
+    with open(file_path) as f:
+        assert list(csv.reader(f)) == [
+            ["foo", "bar"],
+            ["1", "a"],
+            ["2", "b"],
+            ["3", "c"],
+            ["", "d"],
+        ]
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        ([{"a": 1}, {"a": 2}], [["a"], ["1"], ["2"]]),
+        ([{"a": 1, "b": 2}, {"b": 3, "a": 4}], [["a", "b"], ["1", "2"], ["4", "3"]]),
+        ([{"a": 1, "b": 2}, {"a": 3}, {"b": 4, "c": 5}], None),
+        ([{"a": 1, "b": 2}, {"a": 3}], [["a", "b"], ["1", "2"], ["3", ""]]),
+    ],
+)
+def test_csv_writer_matches_dict_writer(tmp_path, data, expected):
+    file_path = tmp_path / "data.csv"
+    if expected is None:
+        with pytest.raises(ValueError):
+            CSVWriter(file_path).write(data)
+        return
+    CSVWriter(file_path).write(data)
+    with open(file_path) as f:
+        assert list(csv.reader(f)) == expected
+
+
+def test_csv_writer_no_data(tmp_path):
+    file_path = tmp_path / "data.csv"
+    CSVWriter(file_path).write([])
+    assert not file_path.exists()
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        [{"a": 1, "b": 2.5}, {"a": True, "b": None}],
+        [{"a": "x,y", "b": 'say "hi"'}, {"a": "line\nbreak", "b": "cr\r"}],
+        [{"a": ""}, {"a": "x"}, {"a": None}],
+        [{"a": "", "b": ""}, {"a": " padded ", "b": "é"}],
+    ],
+)
+def test_csv_writer_matches_csv_module(tmp_path, data):
+    file_path = tmp_path / "data.csv"
+    CSVWriter(file_path).write(data)
+    expected = tmp_path / "expected.csv"
+    with open(expected, "w") as f:
+        writer = csv.DictWriter(f, fieldnames=data[0].keys())
+        writer.writeheader()
+        writer.writerows(data)
+    assert file_path.read_bytes() == expected.read_bytes()
@@ -1,6 +1,12 @@
 import pytest
 
-from dataservice.logs import LoggerDict, LoggingConfigDict, setup_logging
+from dataservice.logs import (
+    LoggerDict,
+    LoggingConfigDict,
+    _get_base_config,
+    _get_logger_config,
+    setup_logging,
+)
 
 
 @pytest.fixture
@@ -61,3 +67,18 @@ def test_setup_logging_custom(mocker):
             loggers={"dataservice": LoggerDict(), "custom_logger": LoggerDict()}
         ).model_dump(by_alias=True)
     )
+
+
+def test_setup_logging_validates_defaults_once(mocker):
+    mocked_dict_config = mocker.patch("dataservice.logs.dictConfig")
+    setup_logging("custom_logger", level="INFO")
+    spy = mocker.spy(LoggingConfigDict, "model_dump")
+    setup_logging("custom_logger", level="INFO")
+    spy.assert_not_called()
+    # Each call gets its own copy, so dictConfig cannot alter the cached defaults
+    first, second = (call.args[0] for call in mocked_dict_config.call_args_list)
+    assert first == second
+    assert first is not second
+    assert first["handlers"] is not _get_base_config()["handlers"]
+    assert first["loggers"]["custom_logger"] == LoggerDict(level="INFO").model_dump()
+    assert _get_logger_config("INFO") == LoggerDict(level="INFO").model_dump()
@@ -1,11 +1,13 @@
+import subprocess
+import sys
 from contextlib import nullcontext as does_not_raise
 from functools import partial, wraps
 
 import pytest
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, FeatureNotFound
 from pydantic import HttpUrl, ValidationError
 
-from dataservice.models import Request, Response
+from dataservice.models import InterceptRequest, Request, Response
 from tests.unit.conftest import ToyClient
 
 
@@ -79,6 +81,14 @@ def test_response_creation(valid_request, valid_url):
     assert response.text == data
 
 
+def test_request_and_response_are_frozen(valid_request, valid_url):
+    with pytest.raises(ValidationError):
+        valid_request.url = "https://example.org/"
+    response = Response(request=valid_request, text="", url=valid_url)
+    with pytest.raises(ValidationError):
+        response.text = "changed"
+
+
 def test_response_html_property(valid_request, valid_url):
     html_string = "<html><body><p>Hello, world!</p></body></html>"
     response = Response(request=valid_request, text=html_string, url=valid_url)
@@ -86,6 +96,54 @@ def test_response_html_property(valid_request, valid_url):
     assert response.html.find("p").text == "Hello, world!"
 
 
+def test_response_html_is_parsed_once(valid_request, valid_url, mocker):
+    spy = mocker.patch("bs4.BeautifulSoup")
+    response = Response(request=valid_request, text="<p>Hi</p>", url=valid_url)
+    assert response.html is response.html
+    spy.assert_called_once_with("<p>Hi</p>", "html5lib")
+
+
+def test_models_do_not_import_bs4():
+    code = "import sys, dataservice.models; print('bs4' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_response_html_follows_copy(valid_request, valid_url):
+    response = Response(request=valid_request, text="<p>old</p>", url=valid_url)
+    assert response.html.p.get_text() == "old"
+    copied = response.model_copy(update={"text": "<p>new</p>"})
+    assert copied.html.p.get_text() == "new"
+
+
+def test_response_html_uses_request_parser(valid_url, dummy_callback):
+    request = Request(
+        url=valid_url, callback=dummy_callback, client=ToyClient(), parser="html.parser"
+    )
+    response = Response(request=request, text="<p>Hello</p>", url=valid_url)
+    assert response.html.find("p").text == "Hello"
+    # html.parser does not add the implicit html and body elements
+    assert response.html.find("body") is None
+
+
+def test_response_html_falls_back_to_html5lib(
+    valid_url, dummy_callback, mocker, caplog
+):
+    soup = mocker.patch("bs4.BeautifulSoup", side_effect=[FeatureNotFound, "soup"])
+    request = Request(
+        url=valid_url, callback=dummy_callback, client=ToyClient(), parser="lxml"
+    )
+    response = Response(request=request, text="<p>Hello</p>", url=valid_url)
+    assert response.html == "soup"
+    assert [call.args for call in soup.call_args_list] == [
+        ("<p>Hello</p>", "lxml"),
+        ("<p>Hello</p>", "html5lib"),
+    ]
+    assert "Parser lxml is not installed, falling back to html5lib." in caplog.text
+
+
 def test_response_html_property_with_json_content_type(valid_data_request, valid_url):
     json_data = {"key": "value"}
     response = Response(request=valid_data_request, data=json_data, url=valid_url)
@@ -231,6 +289,18 @@ def test_ser_model_post_request_with_json_data():
     assert serialized["json_data"] == {"key": "value"}
 
 
+def test_ser_model_only_serializes_fields(valid_request):
+    _ = valid_request.unique_key, valid_request.callback_name
+    serialized = valid_request.ser_model()
+    assert tuple(serialized) == tuple(Request.model_fields)
+    intercept_request = InterceptRequest(
+        url="http://example.com", callback=lambda x: x, parent=valid_request
+    )
+    serialized = intercept_request.ser_model()
+    assert tuple(serialized) == tuple(InterceptRequest.model_fields)
+    assert serialized["client"] == "NoneType"
+
+
 def test_ser_model_invalid_post_request():
     with pytest.raises(ValidationError):
         Request(
@@ -290,6 +360,13 @@ def test_callback_name(callback, expected):
     assert request.callback_name == expected
 
 
+def test_callback_and_client_names_are_cached(valid_request, mocker):
+    spy = mocker.patch("dataservice.models._get_func_name", return_value="name")
+    assert valid_request.callback_name == valid_request.callback_name == "name"
+    assert valid_request.client_name == valid_request.client_name == "name"
+    assert spy.call_count == 2
+
+
 def test_response_headers_property(valid_request, valid_url):
     headers = {"Content-Type": "text/html"}
     response = Response(request=valid_request, text="", url=valid_url, headers=headers)
@@ -334,6 +411,19 @@ def test_request_unique_key(method, params, form_data, json_data, expected_key):
         client=lambda x: x,
     )
     assert request.unique_key == expected_key
+    assert request.unique_key is request.unique_key
+
+
+def test_request_hash_uses_unique_key(valid_url, dummy_callback):
+    kwargs = dict(url=valid_url, callback=dummy_callback, client=ToyClient())
+    request = Request(**kwargs, params={"q": "a"})
+    assert hash(request) == hash(request.unique_key)
+    assert len({request, Request(**kwargs, params={"q": "a"})}) == 1
+    assert len({request, Request(**kwargs, params={"q": "b"})}) == 2
+    intercept_request = InterceptRequest(
+        url=valid_url, callback=dummy_callback, parent=request
+    )
+    assert hash(intercept_request) == hash(intercept_request.unique_key)
 
 
 @pytest.mark.parametrize(
@@ -381,3 +471,37 @@ def test_request_unique_key(method, params, form_data, json_data, expected_key):
 )
 def test_request_url_encoded(req, expected):
     assert req.url_encoded == expected
+    assert req.url_encoded is req.url_encoded
+
+
+@pytest.mark.parametrize(
+    "copy_request",
+    [
+        lambda request: request.model_copy(update={"params": {"page": 2}}),
+        lambda request: request.model_copy(update={"params": {"page": 2}}, deep=True),
+    ],
+)
+def test_request_copies_drop_cached_properties(valid_request, copy_request):
+    request = valid_request.model_copy(update={"params": {"page": 1}})
+    assert request.unique_key == "GET https://example.com/ {'page': 1}"
+    _ = request.callback_name, request.client_name
+    copied = copy_request(request)
+    assert copied.unique_key == "GET https://example.com/ {'page': 2}"
+    assert copied.callback_name == request.callback_name
+    assert request.unique_key == "GET https://example.com/ {'page': 1}"
+
+
+def test_request_url_encoded_follows_copy(valid_request):
+    request = valid_request.model_copy(update={"params": {"page": 1}})
+    assert request.url_encoded == HttpUrl("https://example.com?page=1")
+    copied = request.model_copy(update={"params": {"page": 2}})
+    assert copied.url_encoded == HttpUrl("https://example.com?page=2")
+
+
+def test_request_copy_with_new_params_hashes_differently(valid_request):
+    request = valid_request.model_copy(update={"params": {"q": "a"}})
+    _ = hash(request)
+    copied = request.model_copy(update={"params": {"q": "b"}})
+    assert copied != request
+    assert hash(copied) != hash(request)
+    assert hash(request.model_copy()) == hash(request)
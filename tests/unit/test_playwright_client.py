@@ -1,11 +1,16 @@
-from unittest.mock import AsyncMock
+import re
+from unittest.mock import AsyncMock, MagicMock, PropertyMock
 
 import pytest
 from playwright.async_api import Response as PlaywrightResponse
 from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 from dataservice import DataServiceException, RetryableException
-from dataservice.clients import PlaywrightClient
+from dataservice.clients import (
+    PlaywrightClient,
+    PlaywrightInterceptClient,
+    _InterceptState,
+)
 from dataservice.config import PlaywrightConfig
 from dataservice.exceptions import NonRetryableException, TimeoutException
 from dataservice.models import Request, Response
@@ -202,3 +207,141 @@ async def test_setup(mock_playwright_setup):
     assert context == mock_context
     assert page == mock_page
     assert playwright == mock_playwright
+
+
+@pytest.mark.parametrize(
+    "intercept_url, url, expected",
+    [
+        ("/posts", "https://api.example.com/posts?page=1", True),
+        ("/posts", "https://api.example.com/users", False),
+        (re.compile(r"/posts/\d+$"), "https://api.example.com/posts/1", True),
+        (re.compile(r"/posts/\d+$"), "https://api.example.com/posts/", False),
+        (["/posts", "/users"], "https://api.example.com/users", True),
+        (["/posts", "/users"], "https://api.example.com/comments", False),
+        (["posts?page=1"], "https://api.example.com/posts?page=1", True),
+    ],
+)
+def test_intercept_responses_matcher(intercept_url, url, expected):
+    client = PlaywrightInterceptClient(intercept_url=intercept_url, callback=print)
+    state = _InterceptState()
+    pw_response = MagicMock(url=url)
+
+    client._intercept_responses(pw_response, state)
+
+    assert (state.responses == [pw_response]) is expected
+
+
+def get_intercept_pw_response(url, method="GET", post_data=None):
+    pw_response = MagicMock(url=url)
+    pw_response.request.method = method
+    pw_response.request.post_data_buffer = post_data
+    return pw_response
+
+
+def test_intercept_responses_skips_seen_requests():
+    client = PlaywrightInterceptClient(intercept_url="/posts", callback=print)
+    state = _InterceptState()
+    first = get_intercept_pw_response("https://api.example.com/posts")
+    second = get_intercept_pw_response("https://api.example.com/posts")
+
+    client._intercept_responses(first, state)
+    client._intercept_responses(second, state)
+
+    assert state.responses == [first]
+
+
+def test_intercept_responses_keeps_posts_with_different_data():
+    client = PlaywrightInterceptClient(intercept_url="/graphql", callback=print)
+    state = _InterceptState()
+    url = "https://api.example.com/graphql"
+    first = get_intercept_pw_response(url, "POST", b'{"query": "a"}')
+    second = get_intercept_pw_response(url, "POST", b'{"query": "b"}')
+    repeated = get_intercept_pw_response(url, "POST", b'{"query": "a"}')
+
+    for pw_response in (first, second, repeated):
+        client._intercept_responses(pw_response, state)
+
+    assert state.responses == [first, second]
+
+
+def test_intercept_responses_keeps_binary_posts():
+    client = PlaywrightInterceptClient(intercept_url="/upload", callback=print)
+    state = _InterceptState()
+    url = "https://api.example.com/upload"
+    first = get_intercept_pw_response(url, "POST", b"\x80\x01")
+    second = get_intercept_pw_response(url, "POST", b"\x80\x02")
+    for pw_response in (first, second):
+        type(pw_response.request).post_data = PropertyMock(
+            side_effect=UnicodeDecodeError("utf-8", b"\x80", 0, 1, "invalid start byte")
+        )
+
+    for pw_response in (first, second):
+        client._intercept_responses(pw_response, state)
+
+    assert state.responses == [first, second]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "content_type, expected", [("application/json", {"id": 1}), ("text/html", "ok")]
+)
+async def test_get_intercepted_requests(content_type, expected):
+    client = PlaywrightClient(intercept_url="/posts")
+    state = _InterceptState()
+    pw_response = AsyncMock(url="https://api.example.com/posts")
+    pw_response.headers = {"content-type": content_type}
+    pw_response.json.return_value = {"id": 1}
+    pw_response.text.return_value = "ok"
+    client._intercept_responses(pw_response, state)
+
+    data = await client._get_intercepted_requests(state)
+
+    assert data == {"https://api.example.com/posts": expected}
+    pw_response.request.response.assert_not_called()
+
+
+def get_intercepted_response(url):
+    pw_response = AsyncMock(url=url, status=200)
+    pw_response.headers = {"content-type": "application/json"}
+    pw_response.json.return_value = {"url": url}
+    pw_response.request = MagicMock(
+        url=url, headers={}, method="GET", post_data_json=None
+    )
+    return pw_response
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mock_browser_page", [200], indirect=True)
+async def test_intercept_client_keeps_state_per_request(mock_browser_page):
+    handlers = []
+    mock_browser_page.on = MagicMock(
+        side_effect=lambda event, handler: handlers.append(handler)
+    )
+    page_response = mock_browser_page.goto.return_value
+    intercepted = iter(
+        [
+            get_intercepted_response("https://api.example.com/posts/1"),
+            get_intercepted_response("https://api.example.com/posts/2"),
+        ]
+    )
+
+    async def goto(*args, **kwargs):
+        handlers[-1](next(intercepted))
+        return page_response
+
+    mock_browser_page.goto.side_effect = goto
+    client = PlaywrightInterceptClient(
+        intercept_url="/posts", callback=print, return_html=False
+    )
+    request = get_request(client)
+
+    first = await client.make_request(request)
+    second = await client.make_request(request)
+
+    assert [r.data for r in first] == [{"url": "https://api.example.com/posts/1"}]
+    assert [r.data for r in second] == [{"url": "https://api.example.com/posts/2"}]
+
+
+def test_intercept_client_rejects_empty_intercept_urls():
+    with pytest.raises(ValueError, match="empty sequence"):
+        PlaywrightInterceptClient(intercept_url=[], callback=print)
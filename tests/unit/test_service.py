@@ -1,15 +1,22 @@
 from __future__ import annotations
 
 import asyncio
+import json
+import os
 import signal
+import threading
+import time
 import uuid
+import warnings
 from contextlib import nullcontext as does_not_raise
 
 import pytest
 
+from dataservice.config import ServiceConfig
 from dataservice.data import BaseDataItem
 from dataservice.models import Request, Response
 from dataservice.service import AsyncDataService, DataService
+from dataservice.worker import DataWorker
 from tests.unit.conftest import ToyClient
 
 
@@ -65,11 +72,13 @@ def parse_item(response: Response):
 def test_toy_service(data_service):
     data = tuple(data_service)
     assert len(data) == 40
-    assert set([d["url"] for d in data[:20]]) == set(
-        [f"https://www.foobar.com/item_{i}" for i in range(1, 21)]
-    )
-    assert set([d["url"] for d in data[20:]]) == set(
-        [f"https://www.barbaz.com/item_{i}" for i in range(1, 21)]
+    # Items of both listings can be in flight at once, so only the set of items is fixed
+    assert set([d["url"] for d in data]) == set(
+        [
+            f"https://www.{site}.com/item_{i}"
+            for site in ("foobar", "barbaz")
+            for i in range(1, 21)
+        ]
     )
 
 
@@ -77,11 +86,13 @@ def test_toy_service(data_service):
 async def test_toy_async_service(async_data_service):
     data = [datum async for datum in async_data_service]
     assert len(data) == 40
-    assert set([d["url"] for d in data[:20]]) == set(
-        [f"https://www.foobar.com/item_{i}" for i in range(1, 21)]
-    )
-    assert set([d["url"] for d in data[20:]]) == set(
-        [f"https://www.barbaz.com/item_{i}" for i in range(1, 21)]
+    # Items of both listings can be in flight at once, so only the set of items is fixed
+    assert set([d["url"] for d in data]) == set(
+        [
+            f"https://www.{site}.com/item_{i}"
+            for site in ("foobar", "barbaz")
+            for i in range(1, 21)
+        ]
     )
 
 
@@ -132,3 +143,141 @@ async def test_cleans_up_signal_handlers_correctly(mocker):
     loop = asyncio.get_running_loop()
     loop.remove_signal_handler.assert_any_call(signal.SIGINT)
     loop.remove_signal_handler.assert_any_call(signal.SIGTERM)
+
+
+def test_data_service_uses_one_event_loop(data_service, mocker):
+    run = mocker.spy(asyncio, "run")
+    new_event_loop = mocker.spy(asyncio, "new_event_loop")
+    data = list(data_service)
+    assert len(data) == 40
+    assert run.call_count == 0
+    assert new_event_loop.call_count == 1
+    assert data_service._loop is None
+
+
+@pytest.mark.asyncio
+async def test_async_data_service_streams_items(async_data_service):
+    data = await anext(aiter(async_data_service))
+    assert data["url"].startswith("https://www.")
+    assert not async_data_service._fetch_task.done()
+    remaining = [datum async for datum in async_data_service]
+    assert len(remaining) == 39
+
+
+@pytest.mark.asyncio
+async def test_async_data_service_raises_worker_errors(async_data_service, mocker):
+    await async_data_service._init_data_worker()
+    mocker.patch.object(
+        async_data_service.data_worker, "fetch", side_effect=ValueError("boom")
+    )
+    with pytest.raises(ValueError, match="boom"):
+        await anext(aiter(async_data_service))
+
+
+def test_data_service_raises_worker_errors(data_service, mocker):
+    mocker.patch.object(DataWorker, "fetch", side_effect=ValueError("boom"))
+    with pytest.raises(ValueError, match="boom"):
+        next(iter(data_service))
+    assert data_service._loop is None
+
+
+def parse_page(response: Response):
+    """Mock function that paginates by copying the request with the next page"""
+    page = response.request.params["page"]
+    yield {"page": page}
+    if page < 3:
+        yield response.request.model_copy(update={"params": {"page": page + 1}})
+
+
+def test_service_paginates_with_model_copy():
+    start_request = Request(
+        url="https://www.foobar.com",
+        params={"page": 1},
+        callback=parse_page,
+        client=ToyClient(),
+    )
+    data = list(DataService([start_request]))
+    assert [d["page"] for d in data] == [1, 2, 3]
+
+
+def test_data_service_close_stops_fetching(start_requests):
+    with DataService(start_requests) as service:
+        next(iter(service))
+        loop = service._loop
+        fetch_task = service._fetch_task
+        assert not fetch_task.done()
+    assert fetch_task.done()
+    assert loop.is_closed()
+    assert service._loop is None
+
+
+def test_data_service_warns_when_abandoned(start_requests):
+    service = DataService(start_requests)
+    next(iter(service))
+    with pytest.warns(ResourceWarning, match="Unclosed DataService"):
+        service.__del__()
+    # The loop is left for close to shut down, rather than run from the garbage collector
+    assert not service._loop.is_closed()
+    service.close()
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        service.__del__()
+
+
+@pytest.mark.asyncio
+async def test_async_data_service_aclose_stops_fetching(start_requests):
+    async with AsyncDataService(start_requests) as service:
+        await anext(aiter(service))
+        fetch_task = service._fetch_task
+        assert not fetch_task.done()
+    assert fetch_task.done()
+
+
+async def slow_client(request: Request) -> Response:
+    await asyncio.sleep(5)
+    return await ToyClient()(request)
+
+
+@pytest.fixture
+def interrupted_service_args(tmp_path):
+    requests = [
+        Request(url="https://www.foobar.com", callback=parse_item, client=ToyClient()),
+        Request(url="https://www.barbaz.com", callback=parse_item, client=slow_client),
+    ]
+    cache_path = tmp_path / "cache.json"
+    config = ServiceConfig(cache={"use": True, "path": cache_path})
+    return requests, config, cache_path
+
+
+def assert_interrupted(data, start, cache_path):
+    assert [d["url"] for d in data] == ["https://www.foobar.com/"]
+    assert time.monotonic() - start < 5
+    assert list(json.loads(cache_path.read_text())) == ["GET https://www.foobar.com/"]
+
+
+def test_data_service_stops_on_sigint_with_cache(interrupted_service_args):
+    requests, config, cache_path = interrupted_service_args
+    start = time.monotonic()
+    timer = threading.Timer(0.5, os.kill, (os.getpid(), signal.SIGINT))
+    timer.start()
+    try:
+        data = list(DataService(requests, config))
+    finally:
+        timer.cancel()
+    assert_interrupted(data, start, cache_path)
+    # The handlers are removed once the iteration ends
+    assert signal.getsignal(signal.SIGINT) is signal.default_int_handler
+
+
+@pytest.mark.asyncio
+async def test_async_data_service_stops_on_sigint_with_cache(interrupted_service_args):
+    requests, config, cache_path = interrupted_service_args
+    start = time.monotonic()
+    handle = asyncio.get_running_loop().call_later(
+        0.5, os.kill, os.getpid(), signal.SIGINT
+    )
+    try:
+        data = [datum async for datum in AsyncDataService(requests, config)]
+    finally:
+        handle.cancel()
+    assert_interrupted(data, start, cache_path)
@@ -6,7 +6,7 @@ from unittest.mock import AsyncMock, patch
 import pytest
 
 from dataservice.cache import JsonCache
-from dataservice.config import ServiceConfig
+from dataservice.config import RetryConfig, ServiceConfig
 from dataservice.data import BaseDataItem
 from dataservice.exceptions import (
     DataServiceException,
@@ -16,7 +16,12 @@ from dataservice.exceptions import (
     TimeoutException,
 )
 from dataservice.models import Request, Response
-from dataservice.worker import DataWorker
+from dataservice.worker import (
+    DataWorker,
+    _fingerprint,
+    _get_callback_handler,
+    _get_retry_options,
+)
 from tests.unit.conftest import ToyClient
 
 # TODO Fix broken tests
@@ -236,7 +241,6 @@ async def test__handle_request(
         "dataservice.worker.DataWorker._make_request",
         mocker.AsyncMock(side_effect=side_effect),
     )
-    data_worker._clients = {"toyclient": ToyClient()}
     data_worker.config = ServiceConfig(
         **{
             "retry": {
@@ -298,7 +302,6 @@ async def test_retry_logs(
         "dataservice.worker.DataWorker._make_request",
         mocker.AsyncMock(side_effect=side_effect),
     )
-    data_worker._clients = {"toyclient": ToyClient()}
     data_worker.config = ServiceConfig(
         **{
             "retry": {
@@ -315,6 +318,13 @@ async def test_retry_logs(
         assert caplog.messages[-1] == expected_logs
 
 
+def test_retry_options_built_once_per_config():
+    options = _get_retry_options(RetryConfig(max_attempts=2))
+    assert _get_retry_options(RetryConfig(max_attempts=2)) is options
+    assert _get_retry_options(RetryConfig(max_attempts=3)) is not options
+    assert options["stop"].max_attempt_number == 2
+
+
 @pytest.fixture
 def mock_worker():
     config = ServiceConfig(
@@ -568,6 +578,51 @@ async def test_make_request_uses_cache(data_worker_with_cache, mocker):
     assert result.data == {}
 
 
+@pytest.mark.asyncio
+async def test_make_request_cache_miss_is_bounded(tmp_path, mocker):
+    cache = JsonCache(tmp_path / "cache.json")
+    await cache.load()
+    config = ServiceConfig(max_concurrency=1, cache={"use": True})
+    worker = DataWorker(requests=[], config=config, cache=cache)
+    locked = []
+
+    async def client(request):
+        locked.append(worker._semaphore.locked())
+        return await ToyClient()(request)
+
+    request = Request(url="http://example.com", client=client, callback=lambda x: x)
+    await worker._make_request(request)
+    await worker._make_request(request)
+    # The second call is a cache hit and never reaches the client
+    assert locked == [True]
+    assert not worker._semaphore.locked()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("use_cache", [True, False])
+async def test_make_request_delay_is_bounded(tmp_path, mocker, use_cache):
+    cache = JsonCache(tmp_path / "cache.json")
+    await cache.load()
+    config = ServiceConfig(
+        max_concurrency=1, cache={"use": use_cache}, delay={"amount": 1}
+    )
+    worker = DataWorker(requests=[], config=config, cache=cache)
+    locked = []
+
+    async def sleep(delay):
+        # ToyClient also sleeps, for no time
+        if delay:
+            locked.append(worker._semaphore.locked())
+
+    mocker.patch("dataservice.worker.asyncio.sleep", side_effect=sleep)
+    request = Request(
+        url="http://example.com", client=ToyClient(), callback=lambda x: x
+    )
+    await worker._make_request(request)
+    # The delay is slept while holding the semaphore, whether the cache is used or not
+    assert locked == [True]
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "write_periodically, expected_call_count",
@@ -598,3 +653,138 @@ async def test_data_worker_with_cache_write_periodically(
     data_worker = DataWorker(requests, config=config, cache=cache)
     await data_worker.fetch()
     assert mocked_write_periodically.await_count == expected_call_count
+
+
+@pytest.mark.asyncio
+async def test_fetch_does_not_wait_for_slowest_task_in_batch():
+    unblock = asyncio.Event()
+
+    async def slow_client(request):
+        await asyncio.wait_for(unblock.wait(), timeout=1)
+        return await ToyClient()(request)
+
+    async def fast_client(request):
+        if request.url.endswith("/3"):
+            unblock.set()
+        return await ToyClient()(request)
+
+    requests = [
+        Request(url="http://example.com/1", callback=lambda x: {}, client=slow_client),
+        Request(url="http://example.com/2", callback=lambda x: {}, client=fast_client),
+        Request(url="http://example.com/3", callback=lambda x: {}, client=fast_client),
+    ]
+    config = ServiceConfig(max_concurrency=2, retry={"max_attempts": 1})
+    data_worker = DataWorker(requests, config=config)
+    await data_worker.fetch()
+    # The third request starts as soon as the second finishes, unblocking the first
+    assert data_worker.get_failures() == {}
+    assert data_worker._data_queue.qsize() == 3
+
+
+@pytest.mark.asyncio
+async def test_fetch_cancels_pending_tasks_on_error():
+    cancelled = asyncio.Event()
+
+    async def slow_client(request):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    requests = [
+        Request(url="http://example.com/1", callback=lambda x: {}, client=slow_client),
+        Request(url="http://example.com/2", callback=lambda x: {}, client=ToyClient()),
+    ]
+    data_worker = DataWorker(requests, config=ServiceConfig(max_concurrency=2))
+    data_worker._handle_callback = AsyncMock(
+        side_effect=DataServiceException("Request exception")
+    )
+    with pytest.raises(DataServiceException):
+        await data_worker.fetch()
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+
+def test_seen_requests_store_fingerprints(data_worker):
+    request = Request(
+        url="http://example.com", callback=lambda x: x, client=ToyClient()
+    )
+    assert not data_worker._is_duplicate_request(request)
+    assert data_worker._is_duplicate_request(request)
+    assert data_worker._seen_requests == {_fingerprint(request.unique_key)}
+    assert _fingerprint(request.unique_key).bit_length() <= 128
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("deduplication, expected", [(True, 2), (False, 3)])
+async def test_iter_callbacks_skips_duplicate_requests(deduplication, expected):
+    data_worker = DataWorker(
+        requests=[], config=ServiceConfig(deduplication=deduplication)
+    )
+    data_worker._handle_queue_item = AsyncMock()
+    items = (
+        item for item in (request_with_data_callback, {}, request_with_data_callback)
+    )
+    tasks = [task async for task in data_worker._iter_callbacks(items)]
+    await asyncio.gather(*tasks)
+    assert data_worker._handle_queue_item.await_count == expected
+
+
+def _generator():
+    yield {}
+
+
+async def _async_generator():
+    yield {}
+
+
+@pytest.mark.parametrize(
+    "callback, expected",
+    [
+        (_generator(), DataWorker._iter_generator),
+        (_async_generator(), DataWorker._iter_async_generator),
+        (request_with_data_callback, DataWorker._iter_item),
+        ({}, DataWorker._iter_item),
+        (Foo(parsed="data"), DataWorker._iter_item),
+        (1, None),
+    ],
+)
+def test_get_callback_handler(callback, expected):
+    assert _get_callback_handler(type(callback)) is expected
+
+
+@pytest.mark.asyncio
+async def test_fetch_caps_tasks_from_a_single_callback():
+    in_flight = 0
+    max_in_flight = 0
+
+    async def client(request):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return await ToyClient()(request)
+
+    def parse_listing(response):
+        for i in range(100):
+            yield Request(
+                url=f"http://example.com/item/{i}", callback=lambda x: {}, client=client
+            )
+
+    requests = [
+        Request(url="http://example.com/", callback=parse_listing, client=client)
+    ]
+    data_worker = DataWorker(requests, config=ServiceConfig(max_concurrency=5))
+    tasks_in_flight = []
+    original_wait = asyncio.wait
+
+    async def spy_wait(tasks, **kwargs):
+        tasks_in_flight.append(len(tasks))
+        return await original_wait(tasks, **kwargs)
+
+    with patch("dataservice.worker.asyncio.wait", spy_wait):
+        await data_worker.fetch()
+    assert data_worker._data_queue.qsize() == 100
+    assert max(tasks_in_flight) == 5
+    assert max_in_flight <= 5